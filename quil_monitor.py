@@ -1,11 +1,35 @@
 #!/usr/bin/env python3
+import atexit
 import subprocess
 import json
+import mmap
+from collections import defaultdict
+from contextlib import contextmanager
+from functools import lru_cache
 from datetime import datetime, timedelta
 import re
 import os
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    orjson = None
+    _json_loads = json.loads
+
+try:
+    # Import Reader itself: the unrelated PyPI 'systemd' package also ships a
+    # systemd.journal, but without one
+    from systemd.journal import Reader as JournalReader
+except ImportError:
+    JournalReader = None
 
 # Processing Time Thresholds (seconds)
 THRESHOLDS = {
@@ -23,6 +47,21 @@ THRESHOLDS = {
     }
 }
 
+# Days of history kept in quil_history.json
+HISTORY_DAYS = 30
+
+# Cache Lifetimes (seconds)
+CACHE_TTL = {
+    'coins': 60,     # qclient coin metadata
+    'price': 300     # CoinGecko QUIL price
+}
+
+# Coins at or below this amount are mining rewards, larger ones are transfers
+REWARD_MAX_AMOUNT = 30
+
+# Longest wait for node, qclient or journalctl before giving up (seconds)
+COMMAND_TIMEOUT = 30
+
 # ANSI Colors
 COLORS = {
     'green': '\033[92m',
@@ -33,33 +72,121 @@ COLORS = {
     'cyan': '\033[96m'
 }
 
+# Output Patterns
+# --node-info line label -> (info key, value type)
+_NODE_INFO_FIELDS = {
+    'Prover Ring': ('ring', int),
+    'Active Workers': ('active_workers', int),
+    'Seniority': ('seniority', int),
+    'Owned balance': ('owned_balance', float)
+}
+# qclient coin line: "<amount> QUIL (Coin 0x...) Frame <n>, Timestamp <iso>"
+_COIN_RE = re.compile(r'(?P<amount>[\d.]+)\s*QUIL.*?Timestamp\s*(?P<timestamp>[\d-]+T[\d:]+Z)')
+_CREATE_EVENT = 'creating data shard ring proof'
+_SUBMIT_EVENT = 'submitting data proof'
+_PROOF_EVENT_RE = re.compile(f'{_CREATE_EVENT}|{_SUBMIT_EVENT}')
+_FRAME_NUMBER_RE = re.compile(r'frame_number"\s*:\s*"?(\d+)')
+_FRAME_AGE_RE = re.compile(r'frame_age"\s*:\s*"?([\d.]+)')
+# Release binary name in node_dir: "node-2.0.4.1-linux-amd64"
+_BINARY_RE = re.compile(r'(?P<prefix>node|qclient)-(?P<version>\d+(?:\.\d+)*)-[\w-]+$')
+
+@lru_cache(maxsize=4)
+def _recent_dates(today_ordinal, days):
+    """Date strings for the last `days` days, newest first"""
+    return tuple(datetime.fromordinal(today_ordinal - i).strftime('%Y-%m-%d')
+                 for i in range(days))
+
+def _highlight(pct, color):
+    """Color a proof bucket only when it holds the majority of proofs"""
+    return (COLORS['reset'], COLORS[color])[pct > 50]
+
 class QuilNodeMonitor:
     def __init__(self):
         self.history_file = "quil_history.json"
         self.history = self._load_history()
+        # Guards history while the display's fetches run on worker threads
+        self._history_lock = threading.RLock()
+        self._dirty = False
+        atexit.register(self._flush_history)
         home = os.path.expanduser('~')
         self.node_dir = f"{home}/ceremonyclient/node"
-        self.node_binary = self._get_binary("node")
-        self.qclient_binary = self._get_binary("qclient")
+        binaries = self._get_binaries()
+        self.node_binary = binaries['node']
+        self.qclient_binary = binaries['qclient']
+        self._coins_time = None
+        # Per-date [reward count, reward earnings], kept in step with coin_data
+        self._reward_totals = {}
+        for date, coins in self.history['coin_data'].items():
+            for coin in coins:
+                self._count_reward(date, coin)
+        # Seed from the persisted price so back-to-back runs skip CoinGecko
+        self._price, self._price_time = self.history.get('last_quil_price', (None, 0))
+        self._http = self._create_session()
         
-    def _get_binary(self, prefix):
-        cmd = f'find "{self.node_dir}" -type f -executable -name "{prefix}-*" ! -name "*.dgst*" ! -name "*.sig*" | sort -V | tail -n 1'
-        result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
-        if result.returncode != 0 or not result.stdout.strip():
-            print(f"Error: No {prefix} binary found")
-            sys.exit(1)
-        return result.stdout.strip()
+    def _get_binaries(self):
+        latest = {}
+        try:
+            # Single directory pass keeping the highest version, no sort needed
+            with os.scandir(self.node_dir) as entries:
+                for entry in entries:
+                    match = _BINARY_RE.match(entry.name)
+                    if not match or not entry.is_file():
+                        continue
+                    prefix = match.group('prefix')
+                    version = tuple(int(part) for part in match.group('version').split('.'))
+                    if version > latest.get(prefix, ((),))[0] and os.access(entry.path, os.X_OK):
+                        latest[prefix] = (version, entry.path)
+        except OSError:
+            pass
+        for prefix in ('node', 'qclient'):
+            if prefix not in latest:
+                print(f"Error: No {prefix} binary found")
+                sys.exit(1)
+        return {prefix: path for prefix, (_, path) in latest.items()}
+
+    @contextmanager
+    def _stream_command(self, args, **kwargs):
+        # Log lines are arbitrary bytes, so one bad sequence must not abort the read
+        proc = subprocess.Popen(args, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                                text=True, errors='replace', **kwargs)
+        # Reading stdout has no timeout of its own, so a timer kills a hung child
+        timer = threading.Timer(COMMAND_TIMEOUT, proc.kill)
+        timer.start()
+        try:
+            yield proc
+            proc.wait()
+        finally:
+            timer.cancel()
+            if proc.poll() is None:
+                proc.kill()
+                proc.wait()
+            proc.stdout.close()
+
+    def _create_session(self):
+        # Reuse one keep-alive connection per host instead of a TLS handshake per call
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=2, pool_maxsize=4,
+                              max_retries=Retry(total=2, backoff_factor=0.5))
+        session.mount('https://', adapter)
+        return session
 
     def _load_history(self):
         try:
             if os.path.exists(self.history_file):
-                with open(self.history_file, 'r') as f:
-                    data = json.load(f)
-                    # Ensure all required keys exist
-                    for key in ['daily_metrics', 'daily_earnings', 'landing_rates', 'daily_balance']:
-                        if key not in data or not isinstance(data[key], dict):
-                            data[key] = {}
-                    return data
+                if orjson:
+                    # Parse straight from the mapped file, no intermediate str copy
+                    with open(self.history_file, 'rb') as f, \
+                            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, \
+                            memoryview(mm) as view:
+                        data = orjson.loads(view)
+                else:
+                    with open(self.history_file, 'r') as f:
+                        data = json.load(f)
+                # Ensure all required keys exist
+                for key in ['daily_metrics', 'daily_earnings', 'landing_rates', 'daily_balance', 'journal_state', 'coin_data']:
+                    if key not in data or not isinstance(data[key], dict):
+                        data[key] = {}
+                return data
         except:
             pass
         return self._init_history()
@@ -69,58 +196,108 @@ class QuilNodeMonitor:
             'daily_metrics': {},
             'daily_earnings': {},
             'landing_rates': {},
-            'daily_balance': {}
+            'daily_balance': {},
+            'journal_state': {},
+            'coin_data': {}
         }
 
     def _save_history(self):
-        try:
-            # Keep only last 30 days
-            cutoff = (datetime.now() - timedelta(days=30)).strftime('%Y-%m-%d')
-            for key in self.history:
-                if isinstance(self.history[key], dict):
-                    self.history[key] = {k: v for k, v in self.history[key].items() 
-                                       if isinstance(k, str) and k >= cutoff}
+        # Batch writes: mutations only mark history dirty, _flush_history writes it once
+        self._dirty = True
+
+    def _flush_history(self):
+        with self._history_lock:
+            if not self._dirty:
+                return
+            try:
+                # Keep only last HISTORY_DAYS days
+                cutoff = (datetime.now() - timedelta(days=HISTORY_DAYS)).strftime('%Y-%m-%d')
+                for key in self.history:
+                    if isinstance(self.history[key], dict):
+                        self.history[key] = {k: v for k, v in self.history[key].items() 
+                                           if isinstance(k, str) and k >= cutoff}
             
-            with open(self.history_file, 'w') as f:
-                json.dump(self.history, f, indent=2)
-        except Exception as e:
-            print(f"Error saving history: {e}")
+                # Write a sibling file and swap it in so a crash never truncates history
+                tmp_file = f"{self.history_file}.tmp"
+                # History is machine state, so write it compact rather than pretty-printed
+                if orjson:
+                    with open(tmp_file, 'wb') as f:
+                        f.write(orjson.dumps(self.history))
+                else:
+                    with open(tmp_file, 'w') as f:
+                        json.dump(self.history, f, separators=(',', ':'))
+                os.replace(tmp_file, self.history_file)
+                self._dirty = False
+            except Exception as e:
+                print(f"Error saving history: {e}")
 
     def get_node_info(self):
-        result = subprocess.run([self.node_binary, '--node-info'], 
-                              capture_output=True, text=True)
+        try:
+            result = subprocess.run([self.node_binary, '--node-info'], 
+                                  capture_output=True, text=True, timeout=COMMAND_TIMEOUT)
+        except subprocess.TimeoutExpired:
+            return None
         if result.returncode != 0:
             return None
-            
-        patterns = {
-            'ring': r'Prover Ring: (\d+)',
-            'active_workers': r'Active Workers: (\d+)',
-            'seniority': r'Seniority: (\d+)',
-            'owned_balance': r'Owned balance: ([\d.]+) QUIL'
-        }
-        
-        info = {}
-        for key, pattern in patterns.items():
-            match = re.search(pattern, result.stdout)
-            value = float(match.group(1)) if match else 0
-            info[key] = int(value) if key != 'owned_balance' else value
+
+        info = {key: cast(0) for key, cast in _NODE_INFO_FIELDS.values()}
+        for line in result.stdout.splitlines():
+            label, sep, value = line.partition(':')
+            field = _NODE_INFO_FIELDS.get(label.strip())
+            if not sep or not field or not value.split():
+                continue
+            key, cast = field
+            try:
+                info[key] = cast(value.split()[0])
+            except ValueError:
+                continue
 
         today = datetime.now().strftime('%Y-%m-%d')
-        self.history['daily_balance'][today] = info['owned_balance']
+        with self._history_lock:
+            self.history['daily_balance'][today] = info['owned_balance']
+            self._save_history()
         return info
 
     def get_quil_price(self):
+        now = time.time()
+        if self._price is not None and now - self._price_time < CACHE_TTL['price']:
+            return self._price
+
         try:
-            response = requests.get(
+            response = self._http.get(
                 "https://api.coingecko.com/api/v3/simple/price",
-                params={"ids": "wrapped-quil", "vs_currencies": "usd"}
+                params={"ids": "wrapped-quil", "vs_currencies": "usd"},
+                timeout=5
             )
-            return response.json().get("wrapped-quil", {}).get("usd", 0)
+            price = response.json().get("wrapped-quil", {}).get("usd", 0)
         except:
-            return 0
+            price = 0
+
+        if not price:
+            # A stale price beats USD columns flickering to $0 on a failed lookup
+            return self._price or 0
+
+        self._price = price
+        self._price_time = now
+        with self._history_lock:
+            self.history['last_quil_price'] = [price, self._price_time]
+            self._save_history()
+        return price
+
+    def _record_time(self, tally, value, thresholds):
+        """Count a proof time into its threshold bucket"""
+        if value <= thresholds['good']:
+            tally['good'] += 1
+        elif value <= thresholds['warning']:
+            tally['warning'] += 1
+        else:
+            tally['critical'] += 1
+        tally['total'] += 1
+        tally['sum'] += value
 
-    def calculate_stats(self, times, thresholds):
-        if not times:
+    def calculate_stats(self, tally):
+        total = tally['total']
+        if not total:
             return {
                 'total': 0,
                 'good': 0,
@@ -131,110 +308,287 @@ class QuilNodeMonitor:
                 'critical_pct': 0,
                 'avg_time': 0
             }
-            
-        total = len(times)
-        good = sum(1 for t in times if t <= thresholds['good'])
-        warning = sum(1 for t in times if thresholds['good'] < t <= thresholds['warning'])
-        critical = sum(1 for t in times if t > thresholds['warning'])
         
         return {
             'total': total,
-            'good': good,
-            'warning': warning,
-            'critical': critical,
-            'good_pct': (good/total)*100 if total > 0 else 0,
-            'warning_pct': (warning/total)*100 if total > 0 else 0,
-            'critical_pct': (critical/total)*100 if total > 0 else 0,
-            'avg_time': sum(times)/total if total > 0 else 0
+            'good': tally['good'],
+            'warning': tally['warning'],
+            'critical': tally['critical'],
+            'good_pct': (tally['good']/total)*100,
+            'warning_pct': (tally['warning']/total)*100,
+            'critical_pct': (tally['critical']/total)*100,
+            'avg_time': tally['sum']/total
         }
 
+    def _parse_coin_line(self, line):
+        """Split a qclient coin line into its amount and timestamp strings"""
+        head, quil, _ = line.partition('QUIL')
+        _, stamp, tail = line.partition('Timestamp')
+        if not quil or not stamp:
+            return None
+
+        # Plain token splitting covers the standard layout without the regex engine
+        words = head.split()
+        fields = tail.split()
+        if words and fields:
+            timestamp = fields[0].rstrip(',')
+            if len(timestamp) == 20 and timestamp.endswith('Z'):
+                return words[-1], timestamp
+
+        match = _COIN_RE.search(line)
+        return (match.group('amount'), match.group('timestamp')) if match else None
+
+    def _get_coins_by_date(self):
+        """Get coins bucketed by date, refreshing from qclient when stale"""
+        coin_data = self.history['coin_data']
+        if self._coins_time is not None and time.monotonic() - self._coins_time < CACHE_TTL['coins']:
+            return coin_data
+
+        # Run qclient from the node directory so .config resolves, parsing
+        # lines as the RPC response streams in
+        fetched = defaultdict(list)
+        # ISO timestamps sort as strings, so old coins are dropped before any parsing
+        cutoff = (datetime.now() - timedelta(days=HISTORY_DAYS)).strftime('%Y-%m-%d')
+        try:
+            with self._stream_command(
+                    [self.qclient_binary, 'token', 'coins', 'metadata', '--config', '.config', '--public-rpc'],
+                    cwd=self.node_dir) as proc:
+                for line in proc.stdout:
+                    parsed = self._parse_coin_line(line)
+                    if not parsed:
+                        continue
+                    amount, timestamp = parsed
+                    if timestamp < cutoff:
+                        continue
+                    try:
+                        coin = {'amount': float(amount), 'timestamp': timestamp}
+                    except ValueError:
+                        continue
+                    fetched[coin['timestamp'][:10]].append(coin)
+        except OSError:
+            # qclient missing or not executable
+            return coin_data
+
+        if proc.returncode != 0:
+            # Fall back to the coins recorded by earlier runs
+            return coin_data
+
+        # qclient's listing is authoritative: merged or spent coins drop out of
+        # it, so history only stands in when qclient can't be reached
+        with self._history_lock:
+            self.history['coin_data'] = dict(fetched)
+            self._reward_totals = {}
+            for date, coins in fetched.items():
+                for coin in coins:
+                    self._count_reward(date, coin)
+
+            self._coins_time = time.monotonic()
+            self._save_history()
+            return self.history['coin_data']
+
+    def _count_reward(self, date, coin):
+        if coin['amount'] <= REWARD_MAX_AMOUNT:
+            totals = self._reward_totals.setdefault(date, [0, 0])
+            totals[0] += 1
+            totals[1] += coin['amount']
+
     def get_coin_data(self):
         """Get coin transactions since midnight using correct paths"""
         today = datetime.now().strftime('%Y-%m-%d')
-        
-        # Execute qclient command from node directory with correct paths
-        cmd = f"""cd {self.node_dir} && \
-            ./$(find . -type f -executable -name "qclient-*" ! -name "*.dgst*" ! -name "*.sig*" | sort -V | tail -n 1) \
-            token coins metadata --config .config --public-rpc"""
-        
-        result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
-        
-        coins = 0
-        earnings = 0
-        
-        if result.returncode == 0:
-            for line in result.stdout.splitlines():
-                if 'QUIL' in line and 'Timestamp' in line and today in line:
-                    try:
-                        amount = float(re.search(r'([\d.]+)\s*QUIL', line).group(1))
-                        if amount <= 30:  # Mining reward
-                            coins += 1
-                            earnings += amount
-                    except:
-                        continue
+
+        self._get_coins_by_date()
+        coins, earnings = self._reward_totals.get(today, (0, 0))
 
         if earnings > 0:
-            today = datetime.now().strftime('%Y-%m-%d')
-            self.history['daily_earnings'][today] = earnings
-            self._save_history()
+            with self._history_lock:
+                self.history['daily_earnings'][today] = earnings
+                self._save_history()
 
         return coins, earnings
 
+    def _parse_frame_fields(self, line):
+        """Extract frame_number and frame_age from a journal line"""
+        number = _FRAME_NUMBER_RE.search(line)
+        age = _FRAME_AGE_RE.search(line)
+        if number and age:
+            return int(number.group(1)), float(age.group(1))
+
+        # Fall back to a full decode for layouts the patterns don't cover
+        msg = _json_loads(line)
+        return int(msg.get('frame_number', 0)), float(msg.get('frame_age', 0))
+
+    def _read_journal(self, cursor):
+        """Read new proof events through the journal API, no journalctl fork
+
+        Returns (events, cursor, restarted); restarted means the old cursor was
+        rejected and today was read again from midnight.
+        """
+        reader = JournalReader()
+        try:
+            reader.add_match(_SYSTEMD_UNIT='ceremonyclient.service')
+            resumed = False
+            if cursor:
+                try:
+                    reader.seek_cursor(cursor)
+                    reader.get_next()  # Skip the entry the cursor points at
+                    resumed = True
+                except OSError:
+                    pass
+            restarted = bool(cursor) and not resumed
+            if not resumed:
+                # No cursor yet, or one the journal no longer knows: start at midnight
+                reader.seek_realtime(datetime.now().replace(hour=0, minute=0, second=0, microsecond=0))
+
+            events = []
+            for entry in reader:
+                cursor = entry['__CURSOR']
+                message = entry.get('MESSAGE', '')
+                # MESSAGE comes back as bytes when it isn't valid UTF-8
+                if not isinstance(message, str):
+                    continue
+                event = _PROOF_EVENT_RE.search(message)
+                if event:
+                    events.append((event.group(), message))
+            return events, cursor, restarted
+        finally:
+            reader.close()
+
+    def _read_journalctl(self, cursor):
+        """Read new proof events from journalctl, seeking straight to the last cursor
+
+        Same return as _read_journal.
+        """
+        try:
+            if cursor:
+                events, new_cursor = self._scan_journalctl(['--after-cursor', cursor])
+                if events is not None:
+                    return events, new_cursor or cursor, False
+            # journalctl rejected the cursor (or there is none yet): read today from midnight
+            events, new_cursor = self._scan_journalctl(['--since', 'today'])
+        except OSError:
+            # journalctl missing or not executable
+            return [], cursor, False
+
+        if events is None:
+            # Keep the old cursor so the next run retries the same entries
+            return [], cursor, False
+        return events, new_cursor, bool(cursor)
+
+    def _scan_journalctl(self, since):
+        """Run journalctl from `since`, returning (events, cursor), or (None, None) on failure"""
+        cmd = ['journalctl', '-u', 'ceremonyclient.service', *since,
+               '--show-cursor', '--no-hostname', '-o', 'cat']
+
+        # Filter while the journal streams in rather than through a shell grep
+        events = []
+        new_cursor = None
+        with self._stream_command(cmd) as proc:
+            for line in proc.stdout:
+                event = _PROOF_EVENT_RE.search(line)
+                if event:
+                    events.append((event.group(), line))
+                elif line.startswith('-- cursor: '):
+                    new_cursor = line[len('-- cursor: '):].strip()
+
+        if proc.returncode != 0:
+            return None, None
+        return events, new_cursor
+
+    def _new_journal_state(self):
+        # Proof times are kept as per-stage bucket counts and running sums, not raw
+        # lists. Frame and transaction numbers (counted unique) and creations still
+        # waiting on a submission are kept in full and grow with the day's proofs.
+        return {
+            'cursor': None,
+            'tallies': {stage: {'total': 0, 'good': 0, 'warning': 0, 'critical': 0, 'sum': 0}
+                        for stage in THRESHOLDS},
+            'creation_data': {},
+            'frames': [],
+            'transactions': []
+        }
+
     def process_logs(self):
-        """Process logs using single journalctl command"""
-        cmd = """journalctl -u ceremonyclient.service --since today --no-hostname -o json | grep -E 'creating data shard ring proof|submitting data proof'"""
-        result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
-        
-        creation_data = {}
-        creation_times = []
-        submission_times = []
-        cpu_times = []
-        frames = set()
-        transactions = set()
+        """Process today's proof logs, resuming from the last journal cursor"""
+        today = datetime.now().strftime('%Y-%m-%d')
+        state = self.history['journal_state'].get(today)
+        if not state or 'tallies' not in state:
+            state = self._new_journal_state()
+
+        if JournalReader:
+            events, cursor, restarted = self._read_journal(state['cursor'])
+        else:
+            events, cursor, restarted = self._read_journalctl(state['cursor'])
+        if restarted:
+            # Events were reread from midnight, so counting them on top of the
+            # saved tallies would double every proof
+            state = self._new_journal_state()
+        if cursor:
+            state['cursor'] = cursor
+
+        # Ages of created frames still waiting on their submission
+        creation_ages = {int(k): v for k, v in state['creation_data'].items()}
+        tallies = state['tallies']
+        frames = set(state['frames'])
+        transactions = set(state['transactions'])
+
+        record = self._record_time
+        add_frame = frames.add
+        add_transaction = transactions.add
         
-        for line in result.stdout.splitlines():
+        # Each line comes tagged with the event it matched, so no second substring scan
+        for event, line in events:
+            # Without both fields neither the patterns nor a full decode can help
+            if 'frame_number' not in line or 'frame_age' not in line:
+                continue
             try:
-                data = json.loads(line)
-                msg = json.loads(data.get('MESSAGE', '{}'))
-                frame_number = int(msg.get('frame_number', 0))
-                frame_age = float(msg.get('frame_age', 0))
-                
-                if frame_number > 0 and frame_age > 0:
-                    if "creating data shard ring proof" in data.get('MESSAGE', ''):
-                        creation_times.append(frame_age)
-                        creation_data[frame_number] = frame_age
-                        frames.add(frame_number)
-                    elif "submitting data proof" in data.get('MESSAGE', ''):
-                        submission_times.append(frame_age)
-                        transactions.add(frame_number)
-                        if frame_number in creation_data:
-                            cpu_time = frame_age - creation_data[frame_number]
-                            if cpu_time > 0:
-                                cpu_times.append(cpu_time)
-            except:
+                frame_number, frame_age = self._parse_frame_fields(line)
+            except (ValueError, TypeError, AttributeError):
                 continue
 
+            if frame_number > 0 and frame_age > 0:
+                if event == _CREATE_EVENT:
+                    record(tallies['creation'], frame_age, THRESHOLDS['creation'])
+                    creation_ages[frame_number] = frame_age
+                    add_frame(frame_number)
+                else:
+                    record(tallies['submission'], frame_age, THRESHOLDS['submission'])
+                    add_transaction(frame_number)
+                    created_age = creation_ages.pop(frame_number, None)
+                    if created_age is not None:
+                        cpu_time = frame_age - created_age
+                        if cpu_time > 0:
+                            record(tallies['cpu'], cpu_time, THRESHOLDS['cpu'])
+
+        state['creation_data'] = {str(k): v for k, v in creation_ages.items()}
+        state['frames'] = list(frames)
+        state['transactions'] = list(transactions)
+
         metrics = {
-            'creation': self.calculate_stats(creation_times, THRESHOLDS['creation']),
-            'submission': self.calculate_stats(submission_times, THRESHOLDS['submission']),
-            'cpu': self.calculate_stats(cpu_times, THRESHOLDS['cpu']),
+            'creation': self.calculate_stats(tallies['creation']),
+            'submission': self.calculate_stats(tallies['submission']),
+            'cpu': self.calculate_stats(tallies['cpu']),
             'frames': len(frames),
             'submitted': len(transactions)
         }
 
-        today = datetime.now().strftime('%Y-%m-%d')
-        self.history['daily_metrics'][today] = metrics
+        with self._history_lock:
+            self.history['daily_metrics'][today] = metrics
+            self.history['journal_state'] = {today: state}
+            self._save_history()
         return metrics
 
     def get_earnings_history(self, days=7):
         """Get earnings history with landing rates"""
         history_data = []
-        today = datetime.now().date()
+        daily_earnings = self.history.get('daily_earnings', {})
+        landing_rates = self.history.get('landing_rates', {})
         
-        for i in range(days):
-            date = (today - timedelta(days=i)).strftime('%Y-%m-%d')
-            earnings = float(self.history.get('daily_earnings', {}).get(date, 0))
-            landing = self.history.get('landing_rates', {}).get(date, {
+        for date in _recent_dates(datetime.now().toordinal(), days):
+            # The reward buckets keep filling in after a day's last run, but lose
+            # coins once they are merged or spent, so take the larger figure
+            totals = self._reward_totals.get(date, (0, 0))
+            earnings = float(max(totals[1], daily_earnings.get(date, 0)))
+            landing = landing_rates.get(date, {
                 'rate': 0,
                 'coins': 0,
                 'frames': 0
@@ -246,20 +600,29 @@ class QuilNodeMonitor:
         return history_data
 
     def display_stats(self):
-        node_info = self.get_node_info()
+        # The node binary, journal, qclient RPC and CoinGecko are independent
+        # I/O waits, so run them side by side
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            node_info_future = executor.submit(self.get_node_info)
+            metrics_future = executor.submit(self.process_logs)
+            price_future = executor.submit(self.get_quil_price)
+            coins_future = executor.submit(self.get_coin_data)
+
+        node_info = node_info_future.result()
         if not node_info:
             print("Failed to get node info")
             return
 
-        metrics = self.process_logs()
-        quil_price = self.get_quil_price()
-        coins, earnings = self.get_coin_data()
+        metrics = metrics_future.result()
+        quil_price = price_future.result()
+        coins, earnings = coins_future.result()
         
         # Calculate landing rate from actual coins
         landing_rate = (coins / metrics['frames'] * 100) if metrics['frames'] > 0 and coins > 0 else 0
         
         # Store today's data
-        today = datetime.now().strftime('%Y-%m-%d')
+        now = datetime.now()
+        today = now.strftime('%Y-%m-%d')
         if coins > 0 and metrics['frames'] > 0:
             self.history['landing_rates'][today] = {
                 'rate': landing_rate,
@@ -268,6 +631,9 @@ class QuilNodeMonitor:
             }
             self._save_history()
 
+        # One write for everything this refresh changed
+        self._flush_history()
+
         # Get history and calculate averages
         history = self.get_earnings_history(7)
         valid_earnings = [earn for _, earn, _ in history if earn > 0]
@@ -275,55 +641,63 @@ class QuilNodeMonitor:
         weekly_avg = daily_avg * 7
         monthly_avg = daily_avg * 30
 
-        print("\n=== QUIL Node Statistics ===")
-        print(f"Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        # Assemble the report and write it in one go rather than a print per line
+        out = ["\n=== QUIL Node Statistics ==="]
+        out.append(f"Time: {now.strftime('%Y-%m-%d %H:%M:%S')}")
         
-        print(f"\nNode Information:")
-        print(f"Ring: {node_info['ring']}")
-        print(f"Active Workers: {node_info['active_workers']}")
-        print(f"Seniority: {node_info['seniority']}")
-        print(f"QUIL Price: ${quil_price:.4f}")
-        print(f"Balance: {node_info['owned_balance']:.6f} QUIL (${node_info['owned_balance'] * quil_price:.2f})")
+        out.append(f"\nNode Information:")
+        out.append(f"Ring: {node_info['ring']}")
+        out.append(f"Active Workers: {node_info['active_workers']}")
+        out.append(f"Seniority: {node_info['seniority']}")
+        out.append(f"QUIL Price: ${quil_price:.4f}")
+        balance = node_info['owned_balance']
+        out.append(f"Balance: {balance:.6f} QUIL (${balance * quil_price:.2f})")
         
-        print(f"\nEarnings Averages:")
-        print(f"Daily Average:   {daily_avg:.6f} QUIL // ${daily_avg * quil_price:.2f}")
-        print(f"Weekly Average:  {weekly_avg:.6f} QUIL // ${weekly_avg * quil_price:.2f}")
-        print(f"Monthly Average: {monthly_avg:.6f} QUIL // ${monthly_avg * quil_price:.2f}")
+        out.append(f"\nEarnings Averages:")
+        out.append(f"Daily Average:   {daily_avg:.6f} QUIL // ${daily_avg * quil_price:.2f}")
+        out.append(f"Weekly Average:  {weekly_avg:.6f} QUIL // ${weekly_avg * quil_price:.2f}")
+        out.append(f"Monthly Average: {monthly_avg:.6f} QUIL // ${monthly_avg * quil_price:.2f}")
         
-        print(f"\nToday's Performance:")
-        print(f"Earnings: {earnings:.6f} QUIL // ${earnings * quil_price:.2f}")
-        print(f"Landing Rate: {landing_rate:.2f}% ({coins}/{metrics['frames']} frames)")
+        out.append(f"\nToday's Performance:")
+        out.append(f"Earnings: {earnings:.6f} QUIL // ${earnings * quil_price:.2f}")
+        out.append(f"Landing Rate: {landing_rate:.2f}% ({coins}/{metrics['frames']} frames)")
 
-        self._display_section("Creation Stage (Network Latency)", 
+        out.extend(self._display_section("Creation Stage (Network Latency)", 
                           metrics['creation'], 
-                          THRESHOLDS['creation'])
-        self._display_section("Submission Stage (Total Time)", 
+                          THRESHOLDS['creation']))
+        out.extend(self._display_section("Submission Stage (Total Time)", 
                           metrics['submission'], 
-                          THRESHOLDS['submission'])
-        self._display_section("CPU Processing Time", 
+                          THRESHOLDS['submission']))
+        out.extend(self._display_section("CPU Processing Time", 
                           metrics['cpu'], 
-                          THRESHOLDS['cpu'])
+                          THRESHOLDS['cpu']))
 
-        print("\nHistory (Last 7 Days):")
+        out.append("\nHistory (Last 7 Days):")
+        history_row = ("{date}: {earnings:.6f} QUIL // ${usd:.2f} "
+                       "(Landing: {rate:.2f}% - {coins}/{frames} frames)").format
         for date, earnings, landing in history:
-            print(f"{date}: {earnings:.6f} QUIL // ${earnings * quil_price:.2f} "
-                  f"(Landing: {landing['rate']:.2f}% - {landing['coins']}/{landing['frames']} frames)")
+            out.append(history_row(date=date, earnings=earnings, usd=earnings * quil_price, **landing))
+
+        sys.stdout.write('\n'.join(out) + '\n')
 
     def _display_section(self, title, stats, thresholds):
-        print(f"\n{title}:")
-        print(f"  Total Proofs:    {stats['total']}")
-        print(f"  Average Time:    {stats['avg_time']:.2f}s")
+        out = [f"\n{title}:"]
+        out.append(f"  Total Proofs:    {stats['total']}")
+        out.append(f"  Average Time:    {stats['avg_time']:.2f}s")
         
-        good_color = COLORS['green'] if stats['good_pct'] > 50 else COLORS['reset']
-        warning_color = COLORS['yellow'] if stats['warning_pct'] > 50 else COLORS['reset']
-        critical_color = COLORS['red'] if stats['critical_pct'] > 50 else COLORS['reset']
-
-        print(f"  0-{thresholds['good']}s:         "
-              f"{good_color}{stats['good']} proofs ({stats['good_pct']:.1f}%){COLORS['reset']}")
-        print(f"  {thresholds['good']}-{thresholds['warning']}s:     "
-              f"{warning_color}{stats['warning']} proofs ({stats['warning_pct']:.1f}%){COLORS['reset']}")
-        print(f"  >{thresholds['warning']}s:         "
-              f"{critical_color}{stats['critical']} proofs ({stats['critical_pct']:.1f}%){COLORS['reset']}")
+        good_color = _highlight(stats['good_pct'], 'green')
+        warning_color = _highlight(stats['warning_pct'], 'yellow')
+        critical_color = _highlight(stats['critical_pct'], 'red')
+        reset = COLORS['reset']
+        good, warning = thresholds['good'], thresholds['warning']
+
+        out.append(f"  0-{good}s:         "
+                   f"{good_color}{stats['good']} proofs ({stats['good_pct']:.1f}%){reset}")
+        out.append(f"  {good}-{warning}s:     "
+                   f"{warning_color}{stats['warning']} proofs ({stats['warning_pct']:.1f}%){reset}")
+        out.append(f"  >{warning}s:         "
+                   f"{critical_color}{stats['critical']} proofs ({stats['critical_pct']:.1f}%){reset}")
+        return out
 
 def main():
     if os.geteuid() != 0: